@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -19,25 +19,25 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are sets of student emails)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -49,11 +49,16 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets for fast membership checks; return
+    # them as sorted lists so the JSON response is stable
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -71,12 +76,44 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Activity is full")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/{activity_name}/signup_batch")
+async def signup_batch_for_activity(activity_name: str, emails: list[str] = Body(..., embed=True)):
+    """Sign up several students for an activity"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    # Get the specific activity
+    activity = activities[activity_name]
+    new_participants = set(emails)
+
+    # Validate at least one student was given
+    if not emails:
+        raise HTTPException(status_code=400, detail="No emails provided")
+
+    # Validate no student is listed twice in the request
+    if len(new_participants) != len(emails):
+        raise HTTPException(status_code=400, detail="Duplicate email in request")
+
+    # Validate no student is already signed up
+    if not new_participants.isdisjoint(activity["participants"]):
+        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+
+    # Validate max participants not exceeded
+    if len(activity["participants"]) + len(new_participants) > activity["max_participants"]:
+        raise HTTPException(status_code=400, detail="Activity is full")
+
+    # Add students only once every check has passed, so a batch is all or nothing
+    activity["participants"].update(new_participants)
+    return {"message": f"Signed up {len(new_participants)} students for {activity_name}"}
+
+
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+async def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -100,36 +137,36 @@ def unregister_from_activity(activity_name: str, email: str):
             "description": "Team sport focusing on basketball skills and game strategy",
             "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
             "max_participants": 15,
-            "participants": []
+            "participants": set()
         },
         "Tennis Club": {
             "description": "Learn tennis techniques and participate in friendly matches",
             "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
             "max_participants": 10,
-            "participants": []
+            "participants": set()
         },
         "Debate Club": {
             "description": "Develop public speaking and critical thinking skills through debate",
             "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
             "max_participants": 16,
-            "participants": []
+            "participants": set()
         },
         "Mathematics Olympiad": {
             "description": "Advanced problem-solving and mathematical theory",
             "schedule": "Saturdays, 10:00 AM - 12:00 PM",
             "max_participants": 20,
-            "participants": []
+            "participants": set()
         },
         "Drama Club": {
             "description": "Theater performances and acting workshops",
             "schedule": "Thursdays, 4:00 PM - 5:30 PM",
             "max_participants": 25,
-            "participants": []
+            "participants": set()
         },
         "Digital Art Workshop": {
             "description": "Learn digital design, animation, and visual arts",
             "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
             "max_participants": 12,
-            "participants": []
+            "participants": set()
         }
     })
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, activities
+
+# Initial activity data restored before each test
+_INITIAL_STATE = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    }
+}
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a single test client for the FastAPI app, shared by all tests"""
+    with TestClient(app) as c:
+        yield c
+
+
+def _reset_activities():
+    activities.clear()
+    activities.update(copy.deepcopy(_INITIAL_STATE))
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state before each test"""
+    _reset_activities()
+
+
+@pytest.fixture(scope="module")
+def initial_activities(client):
+    """GET /activities once for the initial state, shared by read-only tests
+
+    Resets the global activities as a side effect of setup. The returned dict
+    is shared by every test in the module, so tests must not modify it.
+    """
+    _reset_activities()
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()